@@ -1,6 +1,9 @@
 """Hermes MQTT server for Rhasspy Dialogue Mananger"""
 import asyncio
+import json
 import logging
+import os
+import sys
 import typing
 from collections import defaultdict, deque
 from dataclasses import dataclass
@@ -20,7 +23,6 @@ from rhasspyhermes.base import Message
 from rhasspyhermes.client import GeneratorType, HermesClient, TopicArgs
 from rhasspyhermes.dialogue import (
     DialogueAction,
-    DialogueActionType,
     DialogueConfigure,
     DialogueContinueSession,
     DialogueEndSession,
@@ -43,10 +45,28 @@ from rhasspyhermes.wake import (
     HotwordToggleReason,
 )
 
-from .utils import get_wav_duration
+from .utils import dataclass_to_dict, get_wakeword_id, get_wav_duration
+
+try:
+    # Faster JSON encoding for published messages
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 _LOGGER = logging.getLogger("rhasspydialogue_hermes")
 
+# MQTT topics of message types published without topic arguments
+_MESSAGE_TOPICS: typing.Dict[typing.Type[Message], str] = {}
+
+# Session termination for each reason. Safe to share: they are only serialized as
+# part of a published DialogueSessionEnded, never stored on a session or modified.
+_TERMINATIONS: typing.Dict[
+    DialogueSessionTerminationReason, DialogueSessionTermination
+] = {
+    reason: DialogueSessionTermination(reason=reason)
+    for reason in DialogueSessionTerminationReason
+}
+
 # -----------------------------------------------------------------------------
 
 StartSessionType = typing.Union[
@@ -83,8 +103,13 @@ SoundsType = typing.Union[
 
 # -----------------------------------------------------------------------------
 
+# dataclass(slots=True) requires Python 3.10+
+_DATACLASS_SLOTS: typing.Dict[str, typing.Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SessionInfo:
     """Information for an active or queued dialogue session."""
 
@@ -121,6 +146,7 @@ class DialogueHermesMqtt(HermesClient):
         wakeword_ids: typing.Optional[typing.List[str]] = None,
         sound_paths: typing.Optional[typing.Dict[str, Path]] = None,
         session_timeout: float = 30.0,
+        max_queued_sessions: int = 32,
     ):
         super().__init__("rhasspydialogue_hermes", client, site_ids=site_ids)
 
@@ -137,18 +163,25 @@ class DialogueHermesMqtt(HermesClient):
             AudioPlayFinished,
         )
 
+        if max_queued_sessions < 1:
+            raise ValueError(
+                f"max_queued_sessions must be at least 1 (got {max_queued_sessions})"
+            )
+
         self.session: typing.Optional[SessionInfo] = None
-        self.session_queue: typing.Deque[SessionInfo] = deque()
+        self.session_queue: typing.Deque[SessionInfo] = deque(
+            maxlen=max_queued_sessions
+        )
 
-        self.wakeword_ids: typing.Set[str] = set(wakeword_ids or [])
+        self.wakeword_ids: typing.FrozenSet[str] = frozenset(wakeword_ids or [])
         self.sound_paths = sound_paths or {}
 
         # Session timeout
         self.session_timeout = session_timeout
 
-        # Async events and ids for specific messages
-        self.message_events: typing.Dict[
-            typing.Type[Message], typing.Dict[typing.Optional[str], asyncio.Event]
+        # Futures waiting on specific messages by id (resolved in on_message)
+        self.message_futures: typing.Dict[
+            typing.Type[Message], typing.Dict[typing.Optional[str], asyncio.Future]
         ] = defaultdict(dict)
 
         self.say_finished_timeout: float = 10
@@ -162,6 +195,76 @@ class DialogueHermesMqtt(HermesClient):
         # Intent filter applied to NLU queries by default
         self.default_intent_filter: typing.Optional[typing.List[str]] = None
 
+        # Handlers for incoming messages by exact type (see on_message)
+        self.message_handlers: typing.Dict[
+            typing.Type[Message], typing.Callable[..., GeneratorType]
+        ] = {
+            AsrTextCaptured: self.on_text_captured,
+            AudioPlayFinished: self.on_play_finished,
+            DialogueConfigure: self.on_configure,
+            DialogueStartSession: self.on_start_session,
+            DialogueContinueSession: self.on_continue_session,
+            DialogueEndSession: self.on_end_session,
+            HotwordDetected: self.on_hotword_detected,
+            NluIntent: self.on_intent,
+            NluIntentNotRecognized: self.on_intent_not_recognized,
+            TtsSayFinished: self.on_say_finished,
+        }
+
+    # -------------------------------------------------------------------------
+
+    async def handle_messages_async(
+        self, loop: typing.Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """Handles MQTT messages in event loop."""
+        loop = loop or self.loop or asyncio.get_running_loop()
+
+        if hasattr(asyncio, "eager_task_factory") and isinstance(
+            loop, asyncio.BaseEventLoop
+        ):
+            # Run message handlers inline until they first suspend (Python 3.12+).
+            # Not compatible with uvloop.
+            loop.set_task_factory(asyncio.eager_task_factory)  # type: ignore
+
+        await super().handle_messages_async(loop=loop)
+
+    def subscribe_topics(self, *topics):
+        """Subscribe to one or more MQTT topics with a single SUBSCRIBE packet."""
+        with self.subscribe_lock:
+            self.pending_mqtt_topics.update(topics)
+
+            if self.is_connected:
+                self.all_mqtt_topics.update(self.pending_mqtt_topics)
+
+                # Don't re-subscribe
+                new_topics = [
+                    (topic, 0)
+                    for topic in self.pending_mqtt_topics
+                    if topic not in self.subscribed_topics
+                ]
+
+                if new_topics:
+                    self.mqtt_client.subscribe(new_topics)
+                    self.subscribed_topics.update(topic for topic, _ in new_topics)
+                    _LOGGER.debug(
+                        "Subscribed to %s", ", ".join(topic for topic, _ in new_topics)
+                    )
+
+                self.pending_mqtt_topics.clear()
+
+    def mqtt_on_disconnect(self, client, userdata, *args):
+        """Disconnected from MQTT broker (reconnect is left to the network loop)."""
+        # paho-mqtt passes rc (and properties for MQTTv5) after userdata
+        try:
+            _LOGGER.warning("Disconnected. Trying to reconnect...")
+
+            if self.loop:
+                self.loop.call_soon_threadsafe(self.mqtt_connected_event.clear)
+
+            self.is_connected = False
+        except Exception:
+            _LOGGER.exception("on_disconnect")
+
     # -------------------------------------------------------------------------
 
     async def handle_start(
@@ -169,7 +272,7 @@ class DialogueHermesMqtt(HermesClient):
     ) -> typing.AsyncIterable[typing.Union[StartSessionType, EndSessionType, SayType]]:
         """Starts or queues a new dialogue session."""
         try:
-            session_id = str(uuid4())
+            session_id = uuid4().hex
             new_session = SessionInfo(
                 session_id=session_id,
                 site_id=start_session.site_id,
@@ -190,10 +293,9 @@ class DialogueHermesMqtt(HermesClient):
         """Start a new session."""
         start_session = new_session.start_session
 
-        if start_session.init.type == DialogueActionType.NOTIFICATION:
+        if isinstance(start_session.init, DialogueNotification):
             # Notification session
             notification = start_session.init
-            assert isinstance(notification, DialogueNotification)
 
             if not self.session:
                 # Create new session just for TTS
@@ -223,7 +325,6 @@ class DialogueHermesMqtt(HermesClient):
         else:
             # Action session
             action = start_session.init
-            assert isinstance(action, DialogueAction)
 
             new_session.custom_data = start_session.custom_data
             new_session.intent_filter = action.intent_filter
@@ -233,7 +334,9 @@ class DialogueHermesMqtt(HermesClient):
                 # Existing session
                 if action.can_be_enqueued:
                     # Queue session for later
-                    self.session_queue.append(new_session)
+                    for queue_result in self.queue_session(new_session):
+                        yield queue_result
+
                     yield DialogueSessionQueued(
                         session_id=new_session.session_id,
                         site_id=new_session.site_id,
@@ -287,10 +390,12 @@ class DialogueHermesMqtt(HermesClient):
                     lang=new_session.lang,
                 )
 
-            # Set up timeout
-            asyncio.create_task(
-                self.handle_session_timeout(new_session.session_id, new_session.step)
-            )
+                # Set up timeout
+                asyncio.create_task(
+                    self.handle_session_timeout(
+                        new_session.session_id, new_session.step
+                    )
+                )
 
     async def handle_continue(
         self, continue_session: DialogueContinueSession
@@ -416,7 +521,7 @@ class DialogueHermesMqtt(HermesClient):
         assert self.session is not None, "No session"
         session = self.session
 
-        if session.start_session.init.type != DialogueActionType.NOTIFICATION:
+        if not isinstance(session.start_session.init, DialogueNotification):
             # Stop listening
             yield AsrStopListening(
                 site_id=session.site_id, session_id=session.session_id
@@ -426,60 +531,98 @@ class DialogueHermesMqtt(HermesClient):
             site_id=site_id,
             session_id=session.session_id,
             custom_data=session.custom_data,
-            termination=DialogueSessionTermination(reason=reason),
+            termination=_TERMINATIONS[reason],
         )
 
         self.session = None
 
-        # Check session queue
-        if self.session_queue:
+        if not self.session_queue:
+            # Enable hotword if no queued sessions
+            yield HotwordToggleOn(
+                site_id=session.site_id, reason=HotwordToggleReason.DIALOGUE_SESSION
+            )
+
+        # Start queued sessions one at a time until one stays active
+        while self.session_queue and (self.session is None):
             _LOGGER.debug("Handling queued session")
             async for start_result in self.start_session(self.session_queue.popleft()):
                 yield start_result
+
+    def queue_session(
+        self, new_session: SessionInfo, jump_queue: bool = False
+    ) -> typing.List[DialogueSessionEnded]:
+        """Add session to queue, dropping a queued session if the queue is full."""
+        dropped_session: typing.Optional[SessionInfo] = None
+        if self.session_queue and (
+            len(self.session_queue) == self.session_queue.maxlen
+        ):
+            # deque will drop session from the opposite end
+            dropped_session = (
+                self.session_queue[-1] if jump_queue else self.session_queue[0]
+            )
+
+        if jump_queue:
+            self.session_queue.appendleft(new_session)
         else:
-            # Enable hotword if no queued sessions
-            yield HotwordToggleOn(
-                site_id=session.site_id, reason=HotwordToggleReason.DIALOGUE_SESSION
+            self.session_queue.append(new_session)
+
+        if dropped_session is None:
+            return []
+
+        _LOGGER.warning(
+            "Session queue is full. Dropped session: %s", dropped_session.session_id
+        )
+
+        return [
+            DialogueSessionEnded(
+                site_id=dropped_session.site_id,
+                session_id=dropped_session.session_id,
+                custom_data=dropped_session.custom_data,
+                termination=_TERMINATIONS[
+                    DialogueSessionTerminationReason.ABORTED_BY_USER
+                ],
             )
+        ]
 
-    async def handle_text_captured(
+    def handle_text_captured(
         self, text_captured: AsrTextCaptured
-    ) -> typing.AsyncIterable[
-        typing.Union[AsrStopListening, HotwordToggleOn, NluQuery]
-    ]:
+    ) -> typing.List[typing.Union[AsrStopListening, HotwordToggleOn, NluQuery]]:
         """Handle ASR text captured for session."""
         try:
             if self.session is None:
-                return
+                return []
 
             _LOGGER.debug("Received text: %s", text_captured.text)
 
             # Record result
             self.session.text_captured = text_captured
 
-            # Stop listening
-            yield AsrStopListening(
-                site_id=text_captured.site_id, session_id=self.session.session_id
-            )
-
-            # Enable hotword
-            yield HotwordToggleOn(
-                site_id=text_captured.site_id,
-                reason=HotwordToggleReason.DIALOGUE_SESSION,
-            )
-
-            # Perform query
-            yield NluQuery(
-                input=text_captured.text,
-                intent_filter=self.session.intent_filter or self.default_intent_filter,
-                session_id=self.session.session_id,
-                site_id=self.session.site_id,
-                wakeword_id=text_captured.wakeword_id or self.session.wakeword_id,
-                lang=text_captured.lang or self.session.lang,
-            )
+            return [
+                # Stop listening
+                AsrStopListening(
+                    site_id=text_captured.site_id, session_id=self.session.session_id
+                ),
+                # Enable hotword
+                HotwordToggleOn(
+                    site_id=text_captured.site_id,
+                    reason=HotwordToggleReason.DIALOGUE_SESSION,
+                ),
+                # Perform query
+                NluQuery(
+                    input=text_captured.text,
+                    intent_filter=self.session.intent_filter
+                    or self.default_intent_filter,
+                    session_id=self.session.session_id,
+                    site_id=self.session.site_id,
+                    wakeword_id=text_captured.wakeword_id or self.session.wakeword_id,
+                    lang=text_captured.lang or self.session.lang,
+                ),
+            ]
         except Exception:
             _LOGGER.exception("handle_text_captured")
 
+        return []
+
     async def handle_recognized(self, recognition: NluIntent) -> None:
         """Intent successfully recognized."""
         try:
@@ -535,7 +678,8 @@ class DialogueHermesMqtt(HermesClient):
         """Wake word was detected."""
         try:
             session_id = (
-                detected.session_id or f"{detected.site_id}-{wakeword_id}-{uuid4()}"
+                detected.session_id
+                or f"{detected.site_id}-{wakeword_id}-{os.urandom(8).hex()}"
             )
             new_session = SessionInfo(
                 session_id=session_id,
@@ -558,7 +702,8 @@ class DialogueHermesMqtt(HermesClient):
 
             if self.session:
                 # Jump the queue
-                self.session_queue.appendleft(new_session)
+                for queue_result in self.queue_session(new_session, jump_queue=True):
+                    yield queue_result
 
                 # Abort previous session
                 async for end_result in self.end_session(
@@ -631,75 +776,166 @@ class DialogueHermesMqtt(HermesClient):
         session_id: typing.Optional[str] = None,
         topic: typing.Optional[str] = None,
     ) -> GeneratorType:
-        if isinstance(message, AsrTextCaptured):
-            # ASR transcription received
-            if (not message.session_id) or (
-                not self.valid_session_id(message.session_id)
-            ):
-                _LOGGER.warning("Ignoring unknown session %s", message.session_id)
-                return
+        handler = self.message_handlers.get(type(message))
+        if handler is None:
+            _LOGGER.warning("Unexpected message: %s", message)
+            return
 
-            async for play_recorded_result in self.maybe_play_sound(
-                "recorded", site_id=message.site_id
-            ):
-                yield play_recorded_result
-
-            async for text_result in self.handle_text_captured(message):
-                yield text_result
-
-        elif isinstance(message, AudioPlayFinished):
-            # Audio output finished
-            play_finished_event = self.message_events[AudioPlayFinished].get(message.id)
-            if play_finished_event:
-                play_finished_event.set()
-        elif isinstance(message, DialogueConfigure):
-            # Configure intent filter
-            self.handle_configure(message)
-        elif isinstance(message, DialogueStartSession):
-            # Start session
-            async for start_result in self.handle_start(message):
-                yield start_result
-        elif isinstance(message, DialogueContinueSession):
-            # Continue session
-            async for continue_result in self.handle_continue(message):
-                yield continue_result
-        elif isinstance(message, DialogueEndSession):
-            # End session
-            async for end_result in self.handle_end(message):
-                yield end_result
-        elif isinstance(message, HotwordDetected):
-            # Wakeword detected
-            assert topic, "Missing topic"
-            wakeword_id = HotwordDetected.get_wakeword_id(topic)
-            if (not self.wakeword_ids) or (wakeword_id in self.wakeword_ids):
-                async for wake_result in self.handle_wake(wakeword_id, message):
-                    yield wake_result
+        async for result in handler(message, topic):
+            yield result
+
+    async def on_text_captured(
+        self, text_captured: AsrTextCaptured, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """ASR transcription received."""
+        if (not text_captured.session_id) or (
+            not self.valid_session_id(text_captured.session_id)
+        ):
+            _LOGGER.warning("Ignoring unknown session %s", text_captured.session_id)
+            return
+
+        async for play_recorded_result in self.maybe_play_sound(
+            "recorded", site_id=text_captured.site_id
+        ):
+            yield play_recorded_result
+
+        for text_result in self.handle_text_captured(text_captured):
+            yield text_result
+
+    async def on_play_finished(
+        self, play_finished: AudioPlayFinished, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """Audio output finished."""
+        play_finished_future = self.message_futures[AudioPlayFinished].pop(
+            play_finished.id, None
+        )
+        if play_finished_future and (not play_finished_future.done()):
+            play_finished_future.set_result(play_finished)
+
+        yield None
+
+    async def on_configure(
+        self, configure: DialogueConfigure, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """Configure intent filter."""
+        self.handle_configure(configure)
+        yield None
+
+    async def on_start_session(
+        self, start_session: DialogueStartSession, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """Start session."""
+        async for start_result in self.handle_start(start_session):
+            yield start_result
+
+    async def on_continue_session(
+        self,
+        continue_session: DialogueContinueSession,
+        topic: typing.Optional[str] = None,
+    ) -> GeneratorType:
+        """Continue session."""
+        async for continue_result in self.handle_continue(continue_session):
+            yield continue_result
+
+    async def on_end_session(
+        self, end_session: DialogueEndSession, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """End session."""
+        async for end_result in self.handle_end(end_session):
+            yield end_result
+
+    async def on_hotword_detected(
+        self, detected: HotwordDetected, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """Wakeword detected."""
+        assert topic, "Missing topic"
+        wakeword_id = get_wakeword_id(topic)
+        if (not self.wakeword_ids) or (wakeword_id in self.wakeword_ids):
+            async for wake_result in self.handle_wake(wakeword_id, detected):
+                yield wake_result
+        else:
+            _LOGGER.warning("Ignoring wake word id=%s", wakeword_id)
+
+    async def on_intent(
+        self, recognition: NluIntent, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """Intent recognized."""
+        await self.handle_recognized(recognition)
+        yield None
+
+    async def on_intent_not_recognized(
+        self,
+        not_recognized: NluIntentNotRecognized,
+        topic: typing.Optional[str] = None,
+    ) -> GeneratorType:
+        """Intent not recognized."""
+        async for play_error_result in self.maybe_play_sound(
+            "error", site_id=not_recognized.site_id
+        ):
+            yield play_error_result
+
+        async for not_recognized_result in self.handle_not_recognized(not_recognized):
+            yield not_recognized_result
+
+    async def on_say_finished(
+        self, say_finished: TtsSayFinished, topic: typing.Optional[str] = None
+    ) -> GeneratorType:
+        """Text to speech finished."""
+        say_finished_future = self.message_futures[TtsSayFinished].pop(
+            say_finished.id, None
+        )
+        if say_finished_future and (not say_finished_future.done()):
+            say_finished_future.set_result(say_finished)
+
+        yield None
+
+    # -------------------------------------------------------------------------
+
+    def publish(self, message: Message, **topic_args):
+        """Publish a Hermes message to MQTT (JSON encoded with orjson if available)."""
+        if message.is_binary_payload() or (
+            type(message).payload is not Message.payload
+        ):
+            # Binary or custom payload
+            super().publish(message, **topic_args)
+            return
+
+        try:
+            if topic_args:
+                topic = message.topic(**topic_args)
             else:
-                _LOGGER.warning("Ignoring wake word id=%s", wakeword_id)
-        elif isinstance(message, NluIntent):
-            # Intent recognized
-            await self.handle_recognized(message)
-        elif isinstance(message, NluIntentNotRecognized):
-            # Intent not recognized
-            async for play_error_result in self.maybe_play_sound(
-                "error", site_id=message.site_id
-            ):
-                yield play_error_result
-
-            async for not_recognized_result in self.handle_not_recognized(message):
-                yield not_recognized_result
-        elif isinstance(message, TtsSayFinished):
-            # Text to speech finished
-            say_finished_event = self.message_events[TtsSayFinished].pop(
-                message.id, None
+                # Topic only depends on message type
+                message_type = type(message)
+                topic = _MESSAGE_TOPICS.get(message_type, "")
+                if not topic:
+                    topic = message_type.topic()
+                    _MESSAGE_TOPICS[message_type] = topic
+
+            message_dict = dataclass_to_dict(message)
+            if orjson is not None:
+                payload = orjson.dumps(message_dict)
+            else:
+                payload = json.dumps(message_dict, ensure_ascii=False).encode()
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("-> %s", message)
+                _LOGGER.debug("Publishing %s bytes(s) to %s", len(payload), topic)
+
+            self.mqtt_client.publish(topic, payload)
+        except Exception:
+            _LOGGER.exception(
+                "publish (message=%s, topic_args=%s)",
+                message.__class__.__name__,
+                topic_args,
             )
-            if say_finished_event:
-                say_finished_event.set()
-        else:
-            _LOGGER.warning("Unexpected message: %s", message)
 
     # -------------------------------------------------------------------------
 
+    async def toggle_wait(self):
+        """Wait after ASR/hotword toggle messages (skipped if there is no delay)."""
+        if self.toggle_delay > 0:
+            await asyncio.sleep(self.toggle_delay)
+
     async def say(
         self,
         text: str,
@@ -713,16 +949,16 @@ class DialogueHermesMqtt(HermesClient):
         ]
     ]:
         """Send text to TTS system and wait for reply."""
-        finished_event = asyncio.Event()
-        finished_id = request_id or str(uuid4())
-        self.message_events[TtsSayFinished][finished_id] = finished_event
+        finished_id = request_id or uuid4().hex
+        finished_future = asyncio.get_running_loop().create_future()
+        self.message_futures[TtsSayFinished][finished_id] = finished_future
 
         # Disable ASR/hotword at site
         yield HotwordToggleOff(site_id=site_id, reason=HotwordToggleReason.TTS_SAY)
         yield AsrToggleOff(site_id=site_id, reason=AsrToggleReason.TTS_SAY)
 
         # Wait for messages to be delivered
-        await asyncio.sleep(self.toggle_delay)
+        await self.toggle_wait()
 
         try:
             # Forward to TTS
@@ -737,15 +973,18 @@ class DialogueHermesMqtt(HermesClient):
                     "Waiting for sayFinished (timeout=%s)", self.say_finished_timeout
                 )
                 await asyncio.wait_for(
-                    finished_event.wait(), timeout=self.say_finished_timeout
+                    finished_future, timeout=self.say_finished_timeout
                 )
         except asyncio.TimeoutError:
             _LOGGER.warning("Did not receive sayFinished before timeout")
         except Exception:
             _LOGGER.exception("say")
         finally:
+            # Stop waiting for sayFinished
+            self.message_futures[TtsSayFinished].pop(finished_id, None)
+
             # Wait for audio to finish play
-            await asyncio.sleep(self.toggle_delay)
+            await self.toggle_wait()
 
             # Re-enable ASR/hotword at site
             yield HotwordToggleOn(site_id=site_id, reason=HotwordToggleReason.TTS_SAY)
@@ -769,12 +1008,15 @@ class DialogueHermesMqtt(HermesClient):
                 return
 
             _LOGGER.debug("Playing WAV %s", str(wav_path))
-            wav_bytes = wav_path.read_bytes()
 
-            request_id = request_id or str(uuid4())
-            finished_event = asyncio.Event()
-            finished_id = request_id
-            self.message_events[AudioPlayFinished][finished_id] = finished_event
+            # Read WAV file without blocking the event loop
+            wav_bytes = await asyncio.get_running_loop().run_in_executor(
+                None, wav_path.read_bytes
+            )
+
+            request_id = request_id or uuid4().hex
+            finished_future = asyncio.get_running_loop().create_future()
+            self.message_futures[AudioPlayFinished][request_id] = finished_future
 
             # Disable ASR/hotword at site
             yield HotwordToggleOff(
@@ -783,7 +1025,7 @@ class DialogueHermesMqtt(HermesClient):
             yield AsrToggleOff(site_id=site_id, reason=AsrToggleReason.PLAY_AUDIO)
 
             # Wait for messages to be delivered
-            await asyncio.sleep(self.toggle_delay)
+            await self.toggle_wait()
 
             try:
                 yield (
@@ -796,14 +1038,17 @@ class DialogueHermesMqtt(HermesClient):
                     wav_duration = get_wav_duration(wav_bytes)
                     wav_timeout = wav_duration + self.sound_timeout_extra
                     _LOGGER.debug("Waiting for playFinished (timeout=%s)", wav_timeout)
-                    await asyncio.wait_for(finished_event.wait(), timeout=wav_timeout)
+                    await asyncio.wait_for(finished_future, timeout=wav_timeout)
             except asyncio.TimeoutError:
-                _LOGGER.warning("Did not receive sayFinished before timeout")
+                _LOGGER.warning("Did not receive playFinished before timeout")
             except Exception:
                 _LOGGER.exception("maybe_play_sound")
             finally:
+                # Stop waiting for playFinished
+                self.message_futures[AudioPlayFinished].pop(request_id, None)
+
                 # Wait for audio to finish playing
-                await asyncio.sleep(self.toggle_delay)
+                await self.toggle_wait()
 
                 # Re-enable ASR/hotword at site
                 yield HotwordToggleOn(
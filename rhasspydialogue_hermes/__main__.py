@@ -2,6 +2,7 @@
 import argparse
 import asyncio
 import logging
+import threading
 import typing
 from pathlib import Path
 
@@ -12,6 +13,12 @@ from . import DialogueHermesMqtt
 
 _LOGGER = logging.getLogger("rhasspydialogue_hermes")
 
+try:
+    # Use libuv-based event loop if available
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore
+
 # -----------------------------------------------------------------------------
 
 
@@ -29,11 +36,20 @@ def main():
         default=30.0,
         help="Seconds before a dialogue session times out (default: 30)",
     )
+    parser.add_argument(
+        "--max-queued-sessions",
+        type=int,
+        default=32,
+        help="Maximum number of queued dialogue sessions (default: 32)",
+    )
     parser.add_argument("--sound", nargs=2, action="append", help="Add WAV id/path")
 
     hermes_cli.add_hermes_args(parser)
     args = parser.parse_args()
 
+    if args.max_queued_sessions < 1:
+        parser.error("--max-queued-sessions must be at least 1")
+
     hermes_cli.setup_logging(args)
     _LOGGER.debug(args)
 
@@ -48,21 +64,109 @@ def main():
         site_ids=args.site_id,
         wakeword_ids=args.wakeword_id,
         session_timeout=args.session_timeout,
+        max_queued_sessions=args.max_queued_sessions,
         sound_paths=sound_paths,
     )
 
-    _LOGGER.debug("Connecting to %s:%s", args.host, args.port)
-    hermes_cli.connect(client, args)
-    client.loop_start()
+    async def run():
+        # Drive MQTT client from event loop instead of a network thread
+        mqtt_loop = MqttAsyncioLoop(client, asyncio.get_running_loop())
+
+        _LOGGER.debug("Connecting to %s:%s", args.host, args.port)
+        hermes_cli.connect(client, args)
+
+        misc_task = asyncio.create_task(mqtt_loop.misc_loop())
+        try:
+            await hermes.handle_messages_async()
+        finally:
+            misc_task.cancel()
 
     try:
         # Run event loop
-        asyncio.run(hermes.handle_messages_async())
+        if uvloop is None:
+            asyncio.run(run())
+        elif hasattr(asyncio, "Runner"):
+            # Python 3.11+
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(run())
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            asyncio.run(run())
     except KeyboardInterrupt:
         pass
     finally:
         _LOGGER.debug("Shutting down")
-        client.loop_stop()
+
+
+# -----------------------------------------------------------------------------
+
+
+class MqttAsyncioLoop:
+    """Runs paho MQTT client network I/O in an asyncio event loop."""
+
+    def __init__(self, client: mqtt.Client, loop: asyncio.AbstractEventLoop):
+        self.client = client
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+
+        # Seconds between keepalive/reconnect checks
+        self.misc_interval: float = 1
+
+        self.client.on_socket_open = self.on_socket_open
+        self.client.on_socket_close = self.on_socket_close
+        self.client.on_socket_register_write = self.on_socket_register_write
+        self.client.on_socket_unregister_write = self.on_socket_unregister_write
+
+    def call_in_loop(self, callback, *args):
+        """Run callback in the event loop thread (reconnect runs in an executor)."""
+        if threading.get_ident() == self.loop_thread_id:
+            callback(*args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def on_socket_open(self, client, userdata, sock):
+        """Read from socket when data is available."""
+        self.call_in_loop(self.loop.add_reader, sock, self.read, sock)
+
+    def read(self, sock):
+        """Read MQTT packets, including any left in the TLS buffer."""
+        rc = self.client.loop_read()
+
+        # A TLS record may hold several packets, but the socket only becomes
+        # readable again when more bytes arrive (see paho's loop()).
+        while (
+            (rc == mqtt.MQTT_ERR_SUCCESS)
+            and (self.client.socket() is sock)
+            and hasattr(sock, "pending")
+            and (sock.pending() > 0)
+        ):
+            rc = self.client.loop_read()
+
+    def on_socket_close(self, client, userdata, sock):
+        """Stop reading from socket."""
+        self.call_in_loop(self.loop.remove_reader, sock)
+
+    def on_socket_register_write(self, client, userdata, sock):
+        """Write to socket when it is writable."""
+        self.call_in_loop(self.loop.add_writer, sock, client.loop_write)
+
+    def on_socket_unregister_write(self, client, userdata, sock):
+        """Stop writing to socket."""
+        self.call_in_loop(self.loop.remove_writer, sock)
+
+    async def misc_loop(self):
+        """Send keepalive pings and reconnect if disconnected."""
+        while True:
+            if self.client.loop_misc() == mqtt.MQTT_ERR_NO_CONN:
+                try:
+                    _LOGGER.debug("Reconnecting to MQTT broker")
+
+                    # Connecting blocks, so keep it out of the event loop
+                    await self.loop.run_in_executor(None, self.client.reconnect)
+                except Exception as e:
+                    _LOGGER.warning("Reconnect failed: %s", e)
+
+            await asyncio.sleep(self.misc_interval)
 
 
 # -----------------------------------------------------------------------------
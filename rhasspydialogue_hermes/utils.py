@@ -1,7 +1,15 @@
 """Utility methods"""
+import dataclasses
+import functools
 import io
+import typing
 import wave
 
+from rhasspyhermes.wake import HotwordDetected
+
+# Cached (attribute name, JSON key) pairs for each dataclass type
+_DATACLASS_KEYS: typing.Dict[type, typing.List[typing.Tuple[str, str]]] = {}
+
 
 def get_wav_duration(wav_bytes: bytes) -> float:
     """Return the real-time duration of a WAV file"""
@@ -15,3 +23,47 @@ def get_wav_duration(wav_bytes: bytes) -> float:
             guess_frames = (len(wav_bytes) - 44) / width
 
             return guess_frames / float(rate)
+
+
+@functools.lru_cache(maxsize=128)
+def get_wakeword_id(topic: str) -> str:
+    """Return the wake word id of a hotword detected topic (cached per topic)"""
+    return HotwordDetected.get_wakeword_id(topic)
+
+
+def dataclass_to_dict(obj: typing.Any) -> typing.Any:
+    """Convert a dataclasses_json object to a JSON-ready dict like to_dict()"""
+    obj_type = type(obj)
+    keys = _DATACLASS_KEYS.get(obj_type)
+    if keys is None:
+        if not dataclasses.is_dataclass(obj_type):
+            if isinstance(obj, (list, tuple)):
+                return [dataclass_to_dict(value) for value in obj]
+
+            if isinstance(obj, dict):
+                return {key: dataclass_to_dict(value) for key, value in obj.items()}
+
+            # Enums and primitives are encoded by the JSON library
+            return obj
+
+        keys = _get_dataclass_keys(obj_type)
+
+    return {json_key: dataclass_to_dict(getattr(obj, name)) for name, json_key in keys}
+
+
+def _get_dataclass_keys(obj_type: type) -> typing.List[typing.Tuple[str, str]]:
+    """Compute and cache JSON keys for a dataclass type (honors letter case)"""
+    class_config = getattr(obj_type, "dataclass_json_config", None) or {}
+    keys: typing.List[typing.Tuple[str, str]] = []
+
+    for field in dataclasses.fields(obj_type):
+        field_config = field.metadata.get("dataclasses_json", {})
+
+        # Class-level letter case takes precedence, as in dataclasses_json
+        letter_case = class_config.get("letter_case") or field_config.get("letter_case")
+        json_key = letter_case(field.name) if letter_case else field.name
+        keys.append((field.name, json_key))
+
+    _DATACLASS_KEYS[obj_type] = keys
+
+    return keys
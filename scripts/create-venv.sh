@@ -35,6 +35,10 @@ grep '^rhasspy-' "${src_dir}/requirements.txt" | \
 
 pip3 ${PIP_INSTALL} -r requirements.txt
 
+# Optional speedups (orjson, uvloop)
+pip3 ${PIP_INSTALL} -r requirements_fast.txt || \
+    echo "Failed to install optional speedups"
+
 # Optional development requirements
 pip3 ${PIP_INSTALL} -r requirements_dev.txt || \
     echo "Failed to install development requirements"
@@ -17,6 +17,11 @@ requirements_path = this_dir / "requirements.txt"
 with open(requirements_path, "r") as requirements_file:
     requirements = requirements_file.read().splitlines()
 
+# Optional speedups (orjson, uvloop)
+requirements_fast_path = this_dir / "requirements_fast.txt"
+with open(requirements_fast_path, "r") as requirements_fast_file:
+    requirements_fast = requirements_fast_file.read().splitlines()
+
 version_path = this_dir / "VERSION"
 with open(version_path, "r") as version_file:
     version = version_file.read().strip()
@@ -29,6 +34,7 @@ setuptools.setup(
     url="https://github.com/rhasspy/rhasspy-dialogue-hermes",
     packages=setuptools.find_packages(),
     install_requires=requirements,
+    extras_require={"fast": requirements_fast},
     entry_points={
         "console_scripts": [
             "rhasspy-dialogue-hermes = rhasspydialogue_hermes.__main__:main"